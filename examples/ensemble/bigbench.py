@@ -35,7 +35,9 @@ def main(
     ds_path: str = "bigbench",
     ds_names: Sequence[str] | Literal["all"] = ("abstract_narrative_understanding",),
     ds_split: str = "default",
-    index_name: Literal["hnswlib", "polar", "whitening"] = "hnswlib",
+    index_name: Literal[
+        "hnswlib", "faiss_hnsw", "cagra", "polar", "whitening", "whitening_pq"
+    ] = "hnswlib",
     sbert_model: str = "all-mpnet-base-v2",
     llm_model: str = "distilgpt2",
     batch_size: int = 16,
@@ -11,12 +11,14 @@ from bocoel import (
     AxServiceOptimizer,
     BruteForceOptimizer,
     CachedIndexEvaluator,
+    CagraIndex,
     ComposedCorpus,
     Corpus,
     CorpusEvaluator,
     Distance,
     Embedder,
     EnsembleEmbedder,
+    FaissHnswIndex,
     HnswlibIndex,
     HuggingfaceEmbedder,
     Index,
@@ -25,6 +27,7 @@ from bocoel import (
     KMedoidsOptimizer,
     Optimizer,
     PolarIndex,
+    PqHnswIndex,
     RandomOptimizer,
     Storage,
     Task,
@@ -73,6 +76,10 @@ def index_backend_and_kwargs(
     match name:
         case "hnswlib":
             return HnswlibIndex, {"threads": index_threads, "batch_size": batch_size}
+        case "cagra":
+            return CagraIndex, {"batch_size": batch_size}
+        case "faiss_hnsw":
+            return FaissHnswIndex, {"batch_size": batch_size}
         case "inverse_cdf":
             return InverseCDFIndex, {
                 "inverse_cdf_backend": HnswlibIndex,
@@ -92,6 +99,12 @@ def index_backend_and_kwargs(
                 "threads": index_threads,
                 "batch_size": batch_size,
             }
+        case "whitening_pq":
+            return WhiteningIndex, {
+                "whitening_backend": PqHnswIndex,
+                "reduced": reduced,
+                "batch_size": batch_size,
+            }
         case _:
             raise ValueError(f"Unknown index backend {name}")
 
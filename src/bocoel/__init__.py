@@ -27,6 +27,7 @@ from .core import (
 )
 from .corpora import (
     Boundary,
+    CagraIndex,
     ComposedCorpus,
     ConcatStorage,
     Corpus,
@@ -34,6 +35,7 @@ from .corpora import (
     Distance,
     Embedder,
     EnsembleEmbedder,
+    FaissHnswIndex,
     FaissIndex,
     HnswlibIndex,
     HuggingfaceEmbedder,
@@ -41,6 +43,7 @@ from .corpora import (
     InverseCDFIndex,
     PandasStorage,
     PolarIndex,
+    PqHnswIndex,
     SbertEmbedder,
     Storage,
     WhiteningIndex,
@@ -56,6 +56,7 @@ class AxServiceOptimizer(Optimizer):
             sobol_steps: The number of steps to use for the Sobol sequence.
             device: The device to use for the optimization.
             workers: The number of workers to use for the optimization.
+                This is the number of trials evaluated per step, in one batch.
             task: The task to use for the optimization.
             acqf: The acquisition function to use for the optimization.
             surrogate: The surrogate model to use for the optimization.
@@ -93,15 +94,14 @@ class AxServiceOptimizer(Optimizer):
         if self._terminate:
             raise StopIteration
 
+        # Callers budget by steps, so each step only requests `workers` trials.
+        # The trials of a step are searched and evaluated as one batch.
         idx_param, done = self._ax_client.get_next_trials(self._workers)
 
         if done:
             self._terminate = True
 
-        return {
-            tidx: self._eval_one_query(tidx, parameters)
-            for tidx, parameters in idx_param.items()
-        }
+        return self._eval_queries(idx_param)
 
     def _create_experiment(self, boundary: Boundary) -> None:
         self._ax_client.create_experiment(
@@ -111,21 +111,32 @@ class AxServiceOptimizer(Optimizer):
             },
         )
 
-    def _eval_one_query(self, tidx: int, parameters: dict[str, float]) -> float:
-        names = params.name_list(len(parameters))
-        query = [[parameters[name] for name in names]]
+    def _eval_queries(
+        self, idx_param: Mapping[int, dict[str, float]]
+    ) -> Mapping[int, float]:
+        if not idx_param:
+            return {}
 
+        trials = list(idx_param.keys())
+        names = params.name_list(len(idx_param[trials[0]]))
+        query = [[idx_param[tidx][name] for name in names] for tidx in trials]
+
+        # Searching and evaluating all the trials in one batch,
+        # s.t. the index and the evaluator can parallelize over the queries.
         # Since k=1, the first index is the one we want.
         indices = self._index.search(query=query).indices[..., 0]
-        value = self._index_eval(indices)[0]
+        values = self._index_eval(indices)
 
         # # Exploration with a maximization entropy setting means maximizing y=0.
         # if self._task is Task.EXPLORE:
         #     value = 0
 
-        self._ax_client.complete_trial(tidx, raw_data={_KEY: value})
+        results: dict[int, float] = {}
+        for tidx, value in zip(trials, values):
+            self._ax_client.complete_trial(tidx, raw_data={_KEY: value})
+            results[tidx] = value
 
-        return value
+        return results
 
     def _gen_strat(self, sobol_steps: int) -> GenerationStrategy:
         modular_kwargs: dict[str, Any] = {"torch_device": self._device}
@@ -94,12 +94,15 @@ class CachedIndexEvaluator(IndexEvaluator):
         if idx.ndim != 1:
             raise ValueError(f"Expected 1D array, got {idx.ndim}D")
 
-        # Only compute the previously unseen indices.
-        unseen = [i for i in idx if i not in self._cache]
+        # Python integers are used as keys, as they are faster to hash than numpy's.
+        keys: list[int] = idx.tolist()
+
+        # Only compute the previously unseen indices, each only once.
+        unseen = list(dict.fromkeys(i for i in keys if i not in self._cache))
 
         if unseen:
             results = self._index_eval(unseen)
             mapped_results = dict(zip(unseen, results))
             self._cache |= mapped_results
 
-        return np.array([self._cache[i] for i in idx])
+        return np.array([self._cache[i] for i in keys])
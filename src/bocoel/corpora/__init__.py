@@ -2,12 +2,15 @@ from .corpora import ComposedCorpus, Corpus
 from .embedders import Embedder, EnsembleEmbedder, HuggingfaceEmbedder, SbertEmbedder
 from .indices import (
     Boundary,
+    CagraIndex,
     Distance,
+    FaissHnswIndex,
     FaissIndex,
     HnswlibIndex,
     Index,
     InverseCDFIndex,
     PolarIndex,
+    PqHnswIndex,
     SearchResult,
     SearchResultBatch,
     WhiteningIndex,
@@ -1,7 +1,9 @@
 import dataclasses as dcls
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from numpy.typing import NDArray
 
 from bocoel.corpora.corpora.interfaces import Corpus
@@ -64,6 +66,7 @@ class ComposedCorpus(Corpus):
         embedder: Embedder,
         transform: Callable[[Mapping[str, Sequence[Any]]], Sequence[str]],
         index_backend: type[Index],
+        cache_dir: str | Path | None = None,
         **index_kwargs: Any,
     ) -> "ComposedCorpus":
         """
@@ -76,13 +79,19 @@ class ComposedCorpus(Corpus):
             embedder: The embedder to use.
             transform: The function to use to transform the storage entries.
             index_backend: The index class to use.
+            cache_dir: The directory to cache the embeddings in.
+                See `Embedder.encode_storage` for more info.
             **index_kwargs: Additional arguments to pass to the index class.
 
         Returns:
             The created corpus.
         """
 
-        embeddings = embedder.encode_storage(storage, transform=transform)
+        # Not pre-allocated, s.t. cached embeddings are memory mapped instead of copied.
+        # The embedder allocates the (float32) array if the embeddings are not cached.
+        embeddings = embedder.encode_storage(
+            storage, transform=transform, cache_dir=cache_dir
+        )
         return cls.index_embeddings(
             embeddings=embeddings,
             storage=storage,
@@ -96,6 +105,7 @@ class ComposedCorpus(Corpus):
         storage: Storage,
         embeddings: NDArray,
         index_backend: type[Index],
+        half: bool = False,
         **index_kwargs: Any,
     ) -> "ComposedCorpus":
         """
@@ -106,11 +116,19 @@ class ComposedCorpus(Corpus):
             storage: The storage to use.
             embeddings: The embeddings to use.
             index_backend: The index class to use.
+            half: Whether to cast the embeddings into half precision (float16).
+                This halves the memory of the embeddings kept by graph indices
+                (e.g. faiss, or hnswlib above its `brute_threshold`).
+                Exact search (hnswlib below its `brute_threshold`) upcasts
+                the embeddings back to single precision, so no memory is saved.
             **index_kwargs: Additional arguments to pass to the index class.
 
         Returns:
             The created corpus.
         """
 
+        if half:
+            embeddings = embeddings.astype(np.float16, copy=False)
+
         index = index_backend(embeddings, **index_kwargs)
         return cls(index=index, storage=storage)
@@ -37,6 +37,16 @@ class EnsembleEmbedder(Embedder):
     def __repr__(self) -> str:
         return f"Ensemble({[str(emb) for emb in self._embedders]})"
 
+    @property
+    def cache_id(self) -> str | None:
+        ids = [emb.cache_id for emb in self._embedders]
+
+        # The ensemble can only be identified if all its embedders can.
+        if any(i is None for i in ids):
+            return None
+
+        return f"Ensemble({ids})"
+
     @property
     def batch(self) -> int:
         return self._batch_size
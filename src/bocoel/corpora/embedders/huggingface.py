@@ -6,6 +6,10 @@ from torch import Tensor
 from bocoel.corpora.embedders.interfaces import Embedder
 
 
+def _logits(output: Any) -> Tensor:
+    return output.logits
+
+
 class HuggingfaceEmbedder(Embedder):
     """
     Huggingface embedder. Uses the transformers library.
@@ -17,7 +21,7 @@ class HuggingfaceEmbedder(Embedder):
         path: str,
         device: str = "cpu",
         batch_size: int = 64,
-        transform: Callable[[Any], Tensor] = lambda output: output.logits,
+        transform: Callable[[Any], Tensor] = _logits,
     ) -> None:
         """
         Initializes the Huggingface embedder.
@@ -27,6 +31,9 @@ class HuggingfaceEmbedder(Embedder):
             device: The device to use.
             batch_size: The batch size for encoding.
             transform: The transformation function to use.
+                Embeddings are only cached (see `Embedder.cache_id`)
+                with the default transform (the logits),
+                because a custom transform cannot be identified.
 
         Raises:
             ImportError: If transformers is not installed.
@@ -55,6 +62,13 @@ class HuggingfaceEmbedder(Embedder):
     def __repr__(self) -> str:
         return f"Huggingface({self._path}, {self.dims})"
 
+    @property
+    def cache_id(self) -> str | None:
+        if self._transform is not _logits:
+            return None
+
+        return f"Huggingface({self._path})"
+
     @property
     def batch(self) -> int:
         return self._batch_size
@@ -1,5 +1,9 @@
 import abc
-from collections.abc import Callable, Mapping, Sequence
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
 from typing import Any, Protocol
 
 import numpy as np
@@ -31,6 +35,8 @@ class Embedder(Protocol):
         storage: Storage,
         /,
         transform: Callable[[Mapping[str, Sequence[Any]]], Sequence[str]],
+        out: NDArray | None = None,
+        cache_dir: str | Path | None = None,
     ) -> NDArray:
         """
         Encodes the storage into embeddings.
@@ -38,14 +44,64 @@ class Embedder(Protocol):
         Parameters:
             storage: The storage to encode.
             transform: The transformation function to use.
+            out: The pre-allocated array to write the embeddings into.
+                Must be of shape `[len(storage), self.dims]`.
+                If not given, a float32 array would be allocated.
+            cache_dir: The directory to cache the embeddings in.
+                The cache is keyed by `self.cache_id` and the transformed texts,
+                and memory mapped (read only) on a cache hit if `out` is not given.
+                If not given, or if the embedder has no `cache_id`,
+                embeddings are not cached.
 
         Returns:
             The encoded embeddings. The shape must be `[len(storage), self.dims]`.
+
+        Raises:
+            ValueError: If `out` does not have the shape `[len(storage), self.dims]`.
         """
 
-        results: list[NDArray] = []
+        shape = (len(storage), self.dims)
+
+        if out is not None and out.shape != shape:
+            raise ValueError(f"Expected out to have shape {shape}, got {out.shape}")
+
+        starts = range(0, len(storage), self.batch)
+        batches: Iterable[Sequence[str]] = (
+            transform(storage[idx : idx + self.batch]) for idx in starts
+        )
+
+        if cache_dir is not None and self.cache_id is None:
+            LOGGER.warning("Embedder has no cache id. Skip caching", embedder=self)
+            cache_dir = None
+
+        path: Path | None = None
+        if cache_dir is not None:
+            # The texts are needed for the cache key, so they are transformed eagerly.
+            batches = list(batches)
+            path = Path(cache_dir) / f"{self._cache_key(batches)}.npy"
+
+            if path.exists():
+                LOGGER.info("Loading cached embeddings", path=str(path))
+                cached = np.load(path, mmap_mode="r")
 
-        for idx in tqdm(range(0, len(storage), self.batch)):
+                if cached.shape != shape:
+                    raise ValueError(
+                        f"Expected cached embeddings to have shape {shape}, "
+                        f"got {cached.shape}. Is {path} corrupted?"
+                    )
+
+                if out is None:
+                    return cached
+
+                out[:] = cached
+                return out
+
+        if out is None:
+            out = np.empty(shape, dtype=np.float32)
+
+        # Batches are written into slices of `out` directly,
+        # s.t. the embeddings are not concatenated (copied) afterwards.
+        for idx, texts in zip(tqdm(starts), batches):
             LOGGER.debug(
                 "Encoding storage",
                 storage=storage,
@@ -53,12 +109,46 @@ class Embedder(Protocol):
                 idx=idx,
                 total=len(storage),
             )
-            batch = storage[idx : idx + self.batch]
-            texts = transform(batch)
             encoded = self.encode(texts)
-            results.append(encoded)
+            out[idx : idx + len(encoded)] = encoded
+
+        if path is not None:
+            LOGGER.info("Saving embeddings to cache", path=str(path))
+            self._save_cache(path, out)
+
+        return out
 
-        return np.concatenate(results, axis=0)
+    @staticmethod
+    def _save_cache(path: Path, embeddings: NDArray) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written to a temporary file first and moved (atomically) in place,
+        # s.t. an interrupted run does not leave a truncated cache behind.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp = Path(f.name)
+
+            try:
+                np.save(f, embeddings)
+            except BaseException:
+                f.close()
+                tmp.unlink()
+                raise
+
+        os.replace(tmp, path)
+
+    def _cache_key(self, batches: Iterable[Sequence[str]]) -> str:
+        assert self.cache_id is not None
+        hasher = hashlib.blake2b(self.cache_id.encode(), digest_size=16)
+        hasher.update(str(self.dims).encode())
+
+        for texts in batches:
+            for text in texts:
+                # Per-text digests, s.t. text boundaries are part of the key.
+                hasher.update(hashlib.blake2b(text.encode(), digest_size=16).digest())
+
+        return hasher.hexdigest()
 
     def encode(self, text: Sequence[str], /) -> NDArray:
         """
@@ -82,6 +172,17 @@ class Embedder(Protocol):
 
         return encoded.cpu().numpy()
 
+    @property
+    def cache_id(self) -> str | None:
+        """
+        The identity of the embedder, used to key the cached embeddings.
+        Embedders that produce different embeddings must have different ids
+        (e.g. the ids should include the model and any configuration).
+        By default this is None, which means that the embeddings are not cached.
+        """
+
+        return None
+
     @property
     @abc.abstractmethod
     def batch(self) -> int:
@@ -40,6 +40,10 @@ class SbertEmbedder(Embedder):
     def __repr__(self) -> str:
         return f"Sbert({self._name})"
 
+    @property
+    def cache_id(self) -> str:
+        return f"Sbert({self._name})"
+
     @property
     def batch(self) -> int:
         return self._batch_size
@@ -4,13 +4,16 @@ Optionally, they may also perform transformation prior to indexing.
 
 The module provides a few index implementations:
 
+- CagraIndex: Uses the cuvs library for nearest neighbor search on GPU.
 - FaissIndex: Uses the Faiss library for fast nearest neighbor search.
+- FaissHnswIndex: Uses Faiss's HNSW graph over 8-bit scalar quantized vectors.
+- PqHnswIndex: Uses Faiss's HNSW graph over product quantized vectors.
 - HnswlibIndex: Uses the hnswlib library for fast nearest neighbor search.
 - PolarIndex: Transforms spatial coordinates into polar coordinates for indexing.
 - WhiteningIndex: Whitens the data before indexing.
 """
 
-from .backend import FaissIndex, HnswlibIndex
+from .backend import CagraIndex, FaissHnswIndex, FaissIndex, HnswlibIndex, PqHnswIndex
 from .interfaces import (
     Boundary,
     Distance,
@@ -24,7 +27,10 @@ from .ppf import InverseCDFIndex
 from .whitening import WhiteningIndex
 
 __all__ = [
+    "CagraIndex",
     "FaissIndex",
+    "FaissHnswIndex",
+    "PqHnswIndex",
     "HnswlibIndex",
     "Boundary",
     "Distance",
@@ -1,2 +1,3 @@
-from .faiss import FaissIndex
+from .cagra import CagraIndex
+from .faiss import FaissHnswIndex, FaissIndex, PqHnswIndex
 from .hnswlib import HnswlibIndex
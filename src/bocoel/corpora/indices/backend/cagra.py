@@ -0,0 +1,124 @@
+import functools
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bocoel.corpora.indices import utils
+from bocoel.corpora.indices.interfaces import Distance, Index, InternalResult
+
+
+@functools.cache
+def _cupy():
+    # Optional dependency.
+    import cupy
+
+    return cupy
+
+
+@functools.cache
+def _cagra():
+    # Optional dependency.
+    from cuvs.neighbors import cagra
+
+    return cagra
+
+
+class CagraIndex(Index):
+    """
+    CAGRA index. Uses the cuvs library, building and searching the graph on GPU.
+    The embeddings are kept on the GPU (as a cupy array) for the lifetime of the index.
+
+    See https://docs.rapids.ai/api/cuvs/stable/ for more info.
+    """
+
+    def __init__(
+        self,
+        embeddings: NDArray,
+        distance: str | Distance,
+        *,
+        normalize: bool = True,
+        graph_degree: int = 64,
+        intermediate_graph_degree: int = 128,
+        itopk_size: int = 64,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Initializes the CAGRA index.
+
+        Parameters:
+            embeddings: The embeddings to index.
+            distance: The distance metric to use.
+            normalize: Whether to normalize the embeddings.
+            graph_degree: The degree of the final graph.
+            intermediate_graph_degree: The degree of the graph before pruning.
+            itopk_size: The size of the internal top-k list during search.
+            batch_size: The batch size to use for searching.
+
+        Raises:
+            ImportError: If cuvs or cupy is not installed.
+        """
+
+        if normalize:
+            embeddings = utils.normalize(embeddings)
+
+        self.__embeddings = embeddings
+
+        self._dist = Distance.lookup(distance)
+        self._batch_size = batch_size
+
+        self._init_index(
+            graph_degree=graph_degree,
+            intermediate_graph_degree=intermediate_graph_degree,
+            itopk_size=itopk_size,
+        )
+
+    @property
+    def batch(self) -> int:
+        return self._batch_size
+
+    @property
+    def data(self) -> NDArray:
+        return self.__embeddings
+
+    @property
+    def distance(self) -> Distance:
+        return self._dist
+
+    def _search(self, query: NDArray, k: int = 1) -> InternalResult:
+        cp = _cupy()
+
+        queries = cp.asarray(query, dtype=cp.float32)
+        distances, indices = _cagra().search(
+            self._search_params, self._index, queries, k
+        )
+
+        return InternalResult(
+            distances=cp.asarray(distances).get(),
+            indices=cp.asarray(indices).get().astype(np.int64),
+        )
+
+    def _init_index(
+        self, graph_degree: int, intermediate_graph_degree: int, itopk_size: int
+    ) -> None:
+        cp = _cupy()
+        cagra = _cagra()
+
+        # Using Any as type hint because cuvs is not type check ready.
+        self._dataset: Any = cp.asarray(self.data, dtype=cp.float32)
+
+        params = cagra.IndexParams(
+            metric=self._cagra_metric(self.distance),
+            graph_degree=graph_degree,
+            intermediate_graph_degree=intermediate_graph_degree,
+        )
+        self._index: Any = cagra.build(params, self._dataset)
+        self._search_params: Any = cagra.SearchParams(itopk_size=itopk_size)
+
+    @staticmethod
+    def _cagra_metric(distance: Distance) -> str:
+        match distance:
+            case Distance.L2:
+                return "sqeuclidean"
+            case Distance.INNER_PRODUCT:
+                return "inner_product"
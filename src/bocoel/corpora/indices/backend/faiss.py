@@ -1,6 +1,6 @@
 import functools
 import warnings
-from typing import Any
+from typing import Any, Literal
 
 from numpy.typing import NDArray
 
@@ -103,3 +103,182 @@ class FaissIndex(Index):
                 return _faiss().METRIC_L2
             case Distance.INNER_PRODUCT:
                 return _faiss().METRIC_INNER_PRODUCT
+
+
+class FaissHnswIndex(Index):
+    """
+    Faiss HNSW index over scalar quantized codes. Uses the faiss library.
+
+    The vectors are stored as 8-bit codes (or 16-bit floats) instead of 32-bit floats,
+    which makes the graph traversal (mostly memory bound) faster.
+    """
+
+    def __init__(
+        self,
+        embeddings: NDArray,
+        distance: str | Distance,
+        *,
+        normalize: bool = True,
+        m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        batch_size: int = 64,
+        quantizer: Literal["8bit", "fp16"] = "8bit",
+    ) -> None:
+        """
+        Initializes the Faiss HNSW index.
+
+        Parameters:
+            embeddings: The embeddings to index.
+            distance: The distance metric to use.
+            normalize: Whether to normalize the embeddings.
+            m: The number of neighbors of each node in the graph.
+            ef_construction: The size of the candidate list during construction.
+            ef_search: The size of the candidate list during search.
+            batch_size: The batch size to use for searching.
+            quantizer: The scalar quantizer to use.
+                "8bit" for 8-bit codes, "fp16" for half precision floats.
+        """
+
+        if normalize:
+            embeddings = utils.normalize(embeddings)
+
+        self.__embeddings = embeddings
+
+        self._batch_size = batch_size
+        self._dist = Distance.lookup(distance)
+
+        self._m = m
+        self._quantizer = quantizer
+        self._init_index(ef_construction=ef_construction, ef_search=ef_search)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._m}, {self._quantizer}, {self.dims})"
+
+    @property
+    def batch(self) -> int:
+        return self._batch_size
+
+    @property
+    def data(self) -> NDArray:
+        return self.__embeddings
+
+    @property
+    def distance(self) -> Distance:
+        return self._dist
+
+    @property
+    def dims(self) -> int:
+        return self.__embeddings.shape[1]
+
+    def _search(self, query: NDArray, k: int = 1) -> InternalResult:
+        distances, indices = self._index.search(query, k)
+        return InternalResult(distances=distances, indices=indices)
+
+    def _init_index(self, ef_construction: int, ef_search: int) -> None:
+        faiss = _faiss()
+        metric = FaissIndex._faiss_metric(self.distance)
+
+        index: Any = faiss.IndexHNSWSQ(
+            self.dims, self._faiss_quantizer(self._quantizer), self._m, metric
+        )
+        index.hnsw.efConstruction = ef_construction
+        index.hnsw.efSearch = ef_search
+
+        # Scalar quantizer needs to learn the range of each dimension.
+        index.train(self.data)
+        index.add(self.data)
+
+        self._index = index
+
+    @staticmethod
+    def _faiss_quantizer(quantizer: str) -> Any:
+        match quantizer:
+            case "8bit":
+                return _faiss().ScalarQuantizer.QT_8bit
+            case "fp16":
+                return _faiss().ScalarQuantizer.QT_fp16
+            case _:
+                raise ValueError(
+                    f"Unknown quantizer: {quantizer}. Must be one of '8bit', 'fp16'"
+                )
+
+
+class PqHnswIndex(FaissHnswIndex):
+    """
+    Faiss HNSW index over product quantized codes. Uses the faiss library.
+
+    Each vector is split into `pq_m` sub-vectors, each encoded with `pq_nbits` bits.
+    Distances are computed with lookup tables, which is both smaller and faster
+    than storing the full vectors, especially on whitened, low dimensional data.
+
+    Requires faiss >= 1.9.0, the first version where `IndexHNSWPQ` takes a metric.
+    """
+
+    def __init__(
+        self,
+        embeddings: NDArray,
+        distance: str | Distance,
+        *,
+        normalize: bool = True,
+        m: int = 16,
+        pq_m: int = 8,
+        pq_nbits: int = 8,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Initializes the Faiss HNSW index with product quantization.
+
+        Parameters:
+            embeddings: The embeddings to index.
+            distance: The distance metric to use.
+            normalize: Whether to normalize the embeddings.
+            m: The number of neighbors of each node in the graph.
+            pq_m: The number of sub-vectors. Must divide the dimensions.
+            pq_nbits: The number of bits to encode each sub-vector.
+            ef_construction: The size of the candidate list during construction.
+            ef_search: The size of the candidate list during search.
+            batch_size: The batch size to use for searching.
+
+        Raises:
+            ValueError: If the dimensions are not divisible by `pq_m`.
+        """
+
+        if (dims := embeddings.shape[1]) % pq_m != 0:
+            raise ValueError(
+                f"Expected dimensions to be divisible by pq_m={pq_m}, got {dims}"
+            )
+
+        self._pq_m = pq_m
+        self._pq_nbits = pq_nbits
+
+        super().__init__(
+            embeddings,
+            distance,
+            normalize=normalize,
+            m=m,
+            ef_construction=ef_construction,
+            ef_search=ef_search,
+            batch_size=batch_size,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._m}, PQ{self._pq_m}x{self._pq_nbits}, {self.dims})"
+
+    def _init_index(self, ef_construction: int, ef_search: int) -> None:
+        faiss = _faiss()
+        metric = FaissIndex._faiss_metric(self.distance)
+
+        index: Any = faiss.IndexHNSWPQ(
+            self.dims, self._pq_m, self._m, self._pq_nbits, metric
+        )
+        index.hnsw.efConstruction = ef_construction
+        index.hnsw.efSearch = ef_search
+
+        # Product quantizer needs to learn the codebooks.
+        index.train(self.data)
+        index.add(self.data)
+
+        self._index = index
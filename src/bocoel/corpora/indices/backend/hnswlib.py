@@ -1,10 +1,14 @@
 from typing import Literal
 
+import numpy as np
+import structlog
 from numpy.typing import NDArray
 
 from bocoel.corpora.indices import utils
 from bocoel.corpora.indices.interfaces import Distance, Index, InternalResult
 
+LOGGER = structlog.get_logger()
+
 _HnswlibDist = Literal["l2", "ip", "cosine"]
 
 
@@ -13,6 +17,10 @@ class HnswlibIndex(Index):
     HNSWLIB index. Uses the hnswlib library.
 
     Score is calculated slightly differently https://github.com/nmslib/hnswlib#supported-distances
+
+    For small corpora, the graph overhead dominates,
+    so exact search with a single matrix multiplication is used instead.
+    The distances are calculated the same way as hnswlib does.
     """
 
     def __init__(
@@ -23,6 +31,10 @@ class HnswlibIndex(Index):
         normalize: bool = True,
         threads: int = -1,
         batch_size: int = 64,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        brute_threshold: int = 50_000,
     ) -> None:
         """
         Initializes the HNSWLIB index.
@@ -31,8 +43,17 @@ class HnswlibIndex(Index):
             embeddings: The embeddings to index.
             distance: The distance metric to use.
             normalize: Whether to normalize the embeddings.
-            threads: The number of threads to use.
+            threads: The number of threads to use. Unused by exact search.
             batch_size: The batch size to use for searching.
+            m: The number of neighbors of each node in the graph.
+                Unused by exact search, as are `ef_construction` and `ef_search`.
+            ef_construction: The size of the candidate list during construction.
+            ef_search: The size of the candidate list during search.
+                Larger values improve recall at the cost of latency.
+                Hnswlib uses `max(ef_search, k)` when searching.
+            brute_threshold: If there are fewer embeddings than this,
+                exact search is performed instead of building the graph.
+                Exact search keeps the embeddings in (at least) single precision.
 
         Raises:
             ValueError: If the distance is not supported.
@@ -50,7 +71,12 @@ class HnswlibIndex(Index):
         # A public attribute because this can be changed at anytime.
         self.threads = threads
 
-        self._init_index()
+        self._brute = len(embeddings) < brute_threshold
+
+        if self._brute:
+            self._init_brute()
+        else:
+            self._init_index(m=m, ef_construction=ef_construction, ef_search=ef_search)
 
     @property
     def batch(self) -> int:
@@ -65,17 +91,86 @@ class HnswlibIndex(Index):
         return self._dist
 
     def _search(self, query: NDArray, k: int = 1) -> InternalResult:
+        if self._brute:
+            return self._brute_search(query, k=k)
+
         indices, distances = self._index.knn_query(query, k=k, num_threads=self.threads)
         return InternalResult(indices=indices, distances=distances)
 
-    def _init_index(self) -> None:
+    def _brute_search(self, query: NDArray, k: int) -> InternalResult:
+        if k > len(self.data):
+            raise ValueError(
+                f"Expected k to be at most {len(self.data)} (the number of items), got {k}"
+            )
+
+        # Queries from the optimizers are float64 (lists of python floats).
+        # Casting the query (like hnswlib does) instead of letting numpy promote,
+        # s.t. the corpus is not upcasted (copied) on every search.
+        query = np.asarray(query, dtype=self.data.dtype)
+
+        # The same as hnswlib, smaller is closer.
+        # See https://github.com/nmslib/hnswlib#supported-distances
+        match self.distance:
+            case Distance.L2:
+                sq_norms = np.einsum("ij,ij->i", query, query)
+                distances = sq_norms[:, None] - 2 * query @ self.data.T + self._sq_norms
+            case Distance.INNER_PRODUCT:
+                distances = 1 - query @ self.data.T
+
+        # TODO: Specialized because the optimizers only search with k=1.
+        # Remove if the optimizers start to search for more neighbors.
+        if k == 1:
+            nearest = distances.argmin(axis=-1)[:, None]
+            return InternalResult(
+                indices=nearest,
+                distances=np.take_along_axis(distances, nearest, axis=-1),
+            )
+
+        if k < len(self.data):
+            # Only the top k are selected and sorted.
+            indices = np.argpartition(distances, k - 1, axis=-1)[:, :k]
+        else:
+            indices = np.broadcast_to(np.arange(len(self.data)), distances.shape)
+
+        top_k = np.take_along_axis(distances, indices, axis=-1)
+        order = np.argsort(top_k, axis=-1)
+
+        return InternalResult(
+            indices=np.take_along_axis(indices, order, axis=-1),
+            distances=np.take_along_axis(top_k, order, axis=-1),
+        )
+
+    def _init_brute(self) -> None:
+        # Contiguous s.t. the matrix multiplication is efficient.
+        # Half precision is upcasted as numpy has no BLAS routine for it,
+        # the same as hnswlib, which only supports single precision.
+        dtype = np.result_type(self.data.dtype, np.float32)
+
+        if self.data.dtype != dtype:
+            LOGGER.warning(
+                "Embeddings are upcasted for exact search, so no memory is saved. "
+                "Use a graph index (lower `brute_threshold`) to keep them in half.",
+                dtype=str(self.data.dtype),
+            )
+
+        # Only the upcasted copy is kept, s.t. the embeddings are not stored twice.
+        self.__embeddings = np.ascontiguousarray(self.data, dtype=dtype)
+        self._sq_norms = np.einsum("ij,ij->i", self.data, self.data)
+
+    def _init_index(self, m: int, ef_construction: int, ef_search: int) -> None:
         # Optional dependency.
         from hnswlib import Index as _HnswlibIndex
 
         space = self._hnswlib_space(self.distance)
         self._index = _HnswlibIndex(space=space, dim=self.dims)
-        self._index.init_index(max_elements=len(self.data))
-        self._index.add_items(self.data, num_threads=self.threads)
+        self._index.init_index(
+            max_elements=len(self.data), ef_construction=ef_construction, M=m
+        )
+        # Hnswlib only supports single precision.
+        self._index.add_items(
+            np.asarray(self.data, dtype=np.float32), num_threads=self.threads
+        )
+        self._index.set_ef(ef_search)
 
     @staticmethod
     def _hnswlib_space(distance: Distance) -> _HnswlibDist:
@@ -25,7 +25,8 @@ class Boundary:
         if self.bounds.shape[1] != 2:
             raise ValueError(f"Expected 2 columns, got {self.bounds.shape[1]}")
 
-        if (self.lower > self.upper).any():
+        # A single comparison over the columns, without going through the properties.
+        if np.any(self.bounds[:, 0] > self.bounds[:, 1]):
             raise ValueError("Expected lower <= upper")
 
     def __len__(self) -> int:
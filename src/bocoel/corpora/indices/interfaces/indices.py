@@ -61,7 +61,8 @@ class Index(Protocol):
             A `SearchResultBatch` instance. See `SearchResultBatch` for details.
         """
 
-        query = np.array(query)
+        # Not copied, as the query is only read.
+        query = np.asarray(query)
 
         if (ndim := query.ndim) != 2:
             raise ValueError(
@@ -74,14 +75,20 @@ class Index(Protocol):
         if k < 1:
             raise ValueError(f"Expected k to be at least 1, got {k}")
 
-        results: list[InternalResult] = []
-        for idx in range(0, len(query), self.batch):
-            query_batch = query[idx : idx + self.batch]
-            result = self._search(query_batch, k=k)
-            results.append(result)
+        # The common case (e.g. a few queries from the optimizer) fits in one batch,
+        # so skip collecting and concatenating the results.
+        if len(query) <= self.batch:
+            distances, indices = self._search(query, k=k)
+        else:
+            results: list[InternalResult] = []
+            for idx in range(0, len(query), self.batch):
+                query_batch = query[idx : idx + self.batch]
+                result = self._search(query_batch, k=k)
+                results.append(result)
+
+            indices = np.concatenate([res.indices for res in results], axis=0)
+            distances = np.concatenate([res.distances for res in results], axis=0)
 
-        indices = np.concatenate([res.indices for res in results], axis=0)
-        distances = np.concatenate([res.distances for res in results], axis=0)
         vectors = self.data[indices]
 
         return SearchResultBatch(
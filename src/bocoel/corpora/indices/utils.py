@@ -19,11 +19,29 @@ def validate_embeddings(
 
 
 def normalize(embeddings: ArrayLike, /, p: int = 2) -> NDArray:
-    embeddings = np.array(embeddings)
+    # No copy here, as the division below creates a new array anyways.
+    embeddings = np.asarray(embeddings)
     validate_embeddings(embeddings, allowed_ndims=[1, 2])
 
+    # Half precision would overflow / lose precision when summing,
+    # so the norm is computed in single precision and the output stays in half.
+    half = embeddings.dtype == np.float16
+    acc = embeddings.astype(np.float32) if half else embeddings
+
     # Axis = -1 works for both 1D and 2D.
-    norm = linalg.norm(embeddings, axis=-1, ord=p, keepdims=True)
+    if p == 2:
+        # Fast path. Sum of squares in a single pass, without temporary arrays.
+        norm = np.sqrt(np.einsum("...i,...i->...", acc, acc))
+        norm = norm[..., None]
+    else:
+        norm = linalg.norm(acc, axis=-1, ord=p, keepdims=True)
+
+    if half:
+        # The upcast copy is owned here, so it is divided in place
+        # instead of allocating another `[N, dims]` temporary.
+        np.divide(acc, norm, out=acc)
+        return acc.astype(np.float16)
+
     return embeddings / norm
 
 
@@ -31,7 +49,8 @@ def boundaries(embeddings: NDArray, /) -> Boundary:
     if embeddings.ndim != 2:
         raise ValueError(f"Expected embeddings to be 2D, got {embeddings.ndim}D")
 
-    return Boundary(np.stack([embeddings.min(axis=0), embeddings.max(axis=0)]).T)
+    # Stacking on the last axis gives `[dims, 2]` directly, without a transpose.
+    return Boundary(np.stack([embeddings.min(axis=0), embeddings.max(axis=0)], axis=-1))
 
 
 def split_search_result_batch(srb: SearchResultBatch, /) -> list[SearchResult]:
@@ -1,6 +1,15 @@
 from typing import Any
 
-from bocoel import FaissIndex, HnswlibIndex, Index, PolarIndex, WhiteningIndex
+from bocoel import (
+    CagraIndex,
+    FaissHnswIndex,
+    FaissIndex,
+    HnswlibIndex,
+    Index,
+    PolarIndex,
+    PqHnswIndex,
+    WhiteningIndex,
+)
 from bocoel.common import ItemNotFound, StrEnum
 
 
@@ -9,15 +18,24 @@ class IndexName(StrEnum):
     The names of the indices.
     """
 
+    CAGRA = "CAGRA"
+    "Corresponds to `CagraIndex`."
+
     FAISS = "FAISS"
     "Corresponds to `FaissIndex`."
 
+    FAISS_HNSW = "FAISS_HNSW"
+    "Corresponds to `FaissHnswIndex`."
+
     HNSWLIB = "HNSWLIB"
     "Corresponds to `HnswlibIndex`."
 
     POLAR = "POLAR"
     "Corresponds to `PolarIndex`."
 
+    PQ_HNSW = "PQ_HNSW"
+    "Corresponds to `PqHnswIndex`."
+
     WHITENING = "WHITENING"
     "Corresponds to `WhiteningIndex`."
 
@@ -33,12 +51,18 @@ def index_class(name: str | IndexName, /) -> type[Index]:
     name = IndexName.lookup(name)
 
     match name:
+        case IndexName.CAGRA:
+            return CagraIndex
         case IndexName.FAISS:
             return FaissIndex
+        case IndexName.FAISS_HNSW:
+            return FaissHnswIndex
         case IndexName.HNSWLIB:
             return HnswlibIndex
         case IndexName.POLAR:
             return PolarIndex
+        case IndexName.PQ_HNSW:
+            return PqHnswIndex
         case IndexName.WHITENING:
             return WhiteningIndex
         case _:
@@ -4,8 +4,10 @@ from bocoel import (
     Adaptor,
     AxServiceOptimizer,
     BruteForceOptimizer,
+    CachedIndexEvaluator,
     Corpus,
     CorpusEvaluator,
+    IndexEvaluator,
     KMeansOptimizer,
     KMedoidsOptimizer,
     Optimizer,
@@ -40,7 +42,13 @@ class OptimizerName(StrEnum):
 
 
 def optimizer(
-    name: str | OptimizerName, /, *, corpus: Corpus, adaptor: Adaptor, **kwargs: Any
+    name: str | OptimizerName,
+    /,
+    *,
+    corpus: Corpus,
+    adaptor: Adaptor,
+    cache: bool = False,
+    **kwargs: Any,
 ) -> Optimizer:
     """
     Create an optimizer instance.
@@ -49,6 +57,11 @@ def optimizer(
         name: The name of the optimizer.
         corpus: The corpus to optimize.
         adaptor: The adaptor to use.
+        cache: Whether to cache the evaluation results by index
+            (with `CachedIndexEvaluator`).
+            This assumes that the adaptor is deterministic,
+            as revisited indices would get the first result back
+            (e.g. sampling generative models would no longer be resampled).
         **kwargs: Additional keyword arguments to pass to the optimizer.
             See the documentation for the specific optimizer for details.
 
@@ -79,5 +92,11 @@ def optimizer(
         case _:
             raise ValueError(f"Unknown optimizer name: {name}")
 
-    corpus_evaluator = CorpusEvaluator(corpus=corpus, adaptor=adaptor)
+    corpus_evaluator: IndexEvaluator = CorpusEvaluator(corpus=corpus, adaptor=adaptor)
+
+    # Optimizers might revisit the same indices (e.g. bayesian optimization converging),
+    # and evaluating the language model is by far the most expensive part.
+    if cache:
+        corpus_evaluator = CachedIndexEvaluator(corpus_evaluator)
+
     return klass(index_eval=corpus_evaluator, index=corpus.index, **kwargs)
@@ -1,7 +1,9 @@
+import functools
 from collections.abc import Mapping, Sequence
 from numbers import Number
 from typing import Any
 
+import numpy as np
 import structlog
 import typeguard
 from numpy.typing import NDArray
@@ -14,6 +16,8 @@ from .interfaces import BigBenchAdaptor
 
 LOGGER = structlog.get_logger()
 
+_NUMERIC_CHOICES_PROMPT = "\nSelect from one of the following (answer in number):\n"
+
 
 class BigBenchChoiceType(StrEnum):
     SUM_OF_SCORES = "SUM_OF_SCORES"
@@ -46,6 +50,12 @@ class BigBenchMultipleChoice(BigBenchAdaptor):
         self._choice_type = BigBenchChoiceType.lookup(choice_type)
         self._score_fn = self._choice_type.score
 
+        # The number of choices that are already checked against `lm.choices`.
+        self._checked_num_choices: set[int] = set()
+
+        # Whether the data has been fully type checked once.
+        self._validated = False
+
     def __repr__(self) -> str:
         return f"BigBenchMC({self.lm}, {self.inputs}, {self.multiple_choice_targets}, {self.multiple_choice_scores}, {self._choice_type})"
 
@@ -63,30 +73,35 @@ class BigBenchMultipleChoice(BigBenchAdaptor):
         )
 
         # Check data.
-        typeguard.check_type("inputs", inputs, Sequence[str])
-        typeguard.check_type("mct", multiple_choice_targets, Sequence[Sequence[str]])
-        typeguard.check_type("mcs", multiple_choice_scores, Sequence[Sequence[Number]])
+        self._check_data(inputs, multiple_choice_targets, multiple_choice_scores)
 
         prompts = [
             self.numeric_choices(question=q, choices=c)
             for q, c in zip(inputs, multiple_choice_targets)
         ]
 
-        # Get the maximum number of choices.
         # Usually every question should have the same number of choices (5).
-        num_choices_per_question = [len(mcs) for mcs in multiple_choice_scores]
+        # In such case, one hot scores are converted to a dense array only once,
+        # and the number of choices as well as the scoring are read from the array.
+        dense_scores = (
+            self._dense_scores(multiple_choice_scores)
+            if isinstance(self._score_fn, OneHotChoiceAccuracy)
+            else None
+        )
 
-        if min(num_choices_per_question) == 0:
+        if dense_scores is not None:
+            num_choices = [dense_scores.shape[1]]
+        else:
+            num_choices = [len(mcs) for mcs in multiple_choice_scores]
+
+        if min(num_choices) == 0:
             raise ValueError(
                 "Multiple choice scores must not be empty. "
                 f"Got {multiple_choice_scores}"
             )
 
-        choices = [str(i) for i in range(1, max(num_choices_per_question) + 1)]
-        if any(choice not in self.lm.choices for choice in choices):
-            raise ValueError(
-                f"Choices {choices} are not in the language model's choices {self.lm.choices}"
-            )
+        # Get the maximum number of choices.
+        self._check_num_choices(max(num_choices))
 
         # Apply classification on the prompts.
         selected = self.lm.classify(prompts)
@@ -97,11 +112,72 @@ class BigBenchMultipleChoice(BigBenchAdaptor):
 
         LOGGER.debug("Generated prompts", chosen=chosen)
 
+        # One hot scores can be gathered at once.
+        if dense_scores is not None:
+            return dense_scores[np.arange(len(chosen)), chosen]
+
         return [
             self._score_fn(target=g, references=s)
             for g, s in zip(chosen, multiple_choice_scores)
         ]
 
+    @staticmethod
+    def _dense_scores(
+        multiple_choice_scores: Sequence[Sequence[Number]],
+    ) -> NDArray | None:
+        """
+        Converts the scores into an array of shape `[batch_size, num_choices]`,
+        or returns None if the questions have different numbers of choices.
+        """
+
+        if len({len(mcs) for mcs in multiple_choice_scores}) != 1:
+            return None
+
+        return np.asarray(multiple_choice_scores, dtype=np.float32)
+
+    def _check_data(
+        self,
+        inputs: Sequence[str],
+        multiple_choice_targets: Sequence[Sequence[str]],
+        multiple_choice_scores: Sequence[Sequence[Number]],
+    ) -> None:
+        # The data comes from the same storage every call,
+        # so it is fully checked only once (that is O(batch * choices)),
+        # and only the first entry is checked afterwards.
+        if not self._validated:
+            _check_type("inputs", inputs, Sequence[str])
+            _check_type("mct", multiple_choice_targets, Sequence[Sequence[str]])
+            _check_type("mcs", multiple_choice_scores, Sequence[Sequence[Number]])
+            self._validated = True
+            return
+
+        if not inputs:
+            return
+
+        if not isinstance(inputs[0], str):
+            raise TypeError(f"Expected inputs to be strings, got {type(inputs[0])}")
+
+        mct = multiple_choice_targets[0]
+        if isinstance(mct, str) or not all(isinstance(t, str) for t in mct):
+            raise TypeError(f"Expected mct to be sequences of strings, got {mct}")
+
+        if np.asarray(multiple_choice_scores[0]).dtype.kind not in "biuf":
+            raise TypeError(
+                f"Expected mcs to be numbers, got {multiple_choice_scores[0]}"
+            )
+
+    def _check_num_choices(self, num_choices: int) -> None:
+        if num_choices in self._checked_num_choices:
+            return
+
+        choices = _numeric_labels(num_choices)
+        if any(choice not in self.lm.choices for choice in choices):
+            raise ValueError(
+                f"Choices {list(choices)} are not in the language model's choices {self.lm.choices}"
+            )
+
+        self._checked_num_choices.add(num_choices)
+
     @staticmethod
     def numeric_choices(question: str, choices: Sequence[str]) -> str:
         """
@@ -110,6 +186,29 @@ class BigBenchMultipleChoice(BigBenchAdaptor):
         """
 
         return (
-            f"{question}\nSelect from one of the following (answer in number):\n"
+            question
+            + _NUMERIC_CHOICES_PROMPT
             + "\n".join(f"{i}) {choice}" for i, choice in enumerate(choices, 1))
         )
+
+
+@functools.cache
+def _numeric_labels(num_choices: int) -> tuple[str, ...]:
+    return tuple(str(i) for i in range(1, num_choices + 1))
+
+
+def _check_type(name: str, value: Any, expected_type: Any) -> None:
+    # Typeguard >= 3 has a different signature, and raises `TypeCheckError`,
+    # which is converted s.t. `TypeError` is raised with both versions.
+    if not hasattr(typeguard, "TypeCheckError"):
+        typeguard.check_type(name, value, expected_type)
+        return
+
+    try:
+        typeguard.check_type(
+            value,
+            expected_type,
+            collection_check_strategy=typeguard.CollectionCheckStrategy.ALL_ITEMS,
+        )
+    except typeguard.TypeCheckError as e:
+        raise TypeError(f"{name} {e}") from e
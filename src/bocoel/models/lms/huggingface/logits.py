@@ -1,7 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import torch
 from numpy.typing import NDArray
+from torch import Tensor
 
 from bocoel.models.lms.interfaces import ClassifierModel
 
@@ -22,6 +25,7 @@ class HuggingfaceLogitsLM(HuggingfaceCausalLM, ClassifierModel):
         device: str,
         choices: Sequence[str],
         add_sep_token: bool = False,
+        workers: int = 1,
     ) -> None:
         """
         Parameters:
@@ -30,6 +34,9 @@ class HuggingfaceLogitsLM(HuggingfaceCausalLM, ClassifierModel):
             device: The device to use.
             choices: The choices to classify.
             add_sep_token: Whether to add the sep token.
+            workers: The number of threads running batches concurrently.
+                Torch releases the GIL during the forward pass,
+                which helps on CPU when a single batch can't saturate the cores.
         """
 
         super().__init__(
@@ -42,21 +49,53 @@ class HuggingfaceLogitsLM(HuggingfaceCausalLM, ClassifierModel):
         self._choices = choices
         self._encoded_choices = self._encode_tokens(self._choices)
 
+        # Kept as a tensor s.t. the logits are gathered on the model's device,
+        # and only `[batch_size, len(choices)]` is moved back to the host.
+        self._choice_ids = torch.tensor(self._encoded_choices, device=self.device)
+
+        self._workers = workers
+
     @property
     def choices(self) -> Sequence[str]:
         return self._choices
 
-    @torch.no_grad()
     def _classify(self, prompts: Sequence[str], /) -> NDArray:
-        tokenized = self._tokenizer(prompts)
-
+        batches = [
+            prompts[idx : idx + self._batch_size]
+            for idx in range(0, len(prompts), self._batch_size)
+        ]
+
+        if not batches:
+            return np.empty([0, len(self.choices)], dtype=np.float32)
+
+        # The (rust) tokenizer is not thread safe, as it is mutated to pad and truncate.
+        # Tokenizing serially here, s.t. only the forward pass is run by the workers.
+        tokenized = [self._tokenizer(batch) for batch in batches]
+
+        if self._workers > 1 and len(batches) > 1:
+            workers = min(self._workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._classify_batch, tokenized))
+        else:
+            results = [self._classify_batch(batch) for batch in tokenized]
+
+        return np.concatenate(results, axis=0)
+
+    # Inference mode is thread local, so it must be set in the function run by the workers.
+    @torch.inference_mode()
+    def _classify_batch(self, tokenized: Mapping[str, Tensor], /) -> NDArray:
         output = self._model(**tokenized)
 
         # Logits has the shape [batch_size, seq_len, vocab_size].
-        logits = output.logits
+        # Only the last position is used, with the shape [batch_size, vocab_size].
+        logits = output.logits[:, -1, :]
+
+        # The model might have been moved with `to` after initialization.
+        if self._choice_ids.device != logits.device:
+            self._choice_ids = self._choice_ids.to(logits.device)
 
-        # Using encoded to select the logits at the last position.
-        result = logits[:, -1, self._encoded_choices]
+        # Using encoded to select the logits of the choices.
+        result = logits.index_select(-1, self._choice_ids)
 
         return result.cpu().numpy()
 
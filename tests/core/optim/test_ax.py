@@ -1,6 +1,20 @@
+from typing import Any
+
+import numpy as np
 import pytest
+from numpy.typing import ArrayLike, NDArray
 
-from bocoel import Manager, SbertEmbedder
+from bocoel import (
+    AcquisitionFunc,
+    AxServiceOptimizer,
+    Distance,
+    HnswlibIndex,
+    IndexEvaluator,
+    Manager,
+    SbertEmbedder,
+    Task,
+)
+from bocoel.corpora import SearchResultBatch
 from tests import utils
 from tests.corpora import factories as corpus_factories
 from tests.models.adaptors import factories as adaptor_factories
@@ -39,3 +53,38 @@ def test_optimize(device: str, workers: int, score: str) -> None:
         adaptor=adaptor,
         steps=10,
     )
+
+
+class CountingIndex(HnswlibIndex):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.searches = 0
+
+    def search(self, query: ArrayLike, k: int = 1) -> SearchResultBatch:
+        self.searches += 1
+        return super().search(query, k=k)
+
+
+class IdentityEvaluator(IndexEvaluator):
+    def __call__(self, idx: ArrayLike, /) -> NDArray:
+        return np.array(idx, dtype=np.float64)
+
+
+def test_step_single_search() -> None:
+    rng = np.random.default_rng(42)
+    index = CountingIndex(rng.standard_normal([20, 4]), distance=Distance.L2)
+    optimizer = AxServiceOptimizer(
+        index_eval=IdentityEvaluator(),
+        index=index,
+        sobol_steps=6,
+        acqf=AcquisitionFunc.UCB,
+        task=Task.MAXIMIZE,
+        workers=3,
+    )
+
+    for step in range(1, 3):
+        results = optimizer.step()
+
+        # Each step evaluates `workers` trials, searched in one batch.
+        assert len(results) == 3, results
+        assert index.searches == step, index.searches
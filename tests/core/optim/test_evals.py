@@ -0,0 +1,25 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from bocoel import CachedIndexEvaluator, IndexEvaluator
+
+
+class CountingEvaluator(IndexEvaluator):
+    def __init__(self) -> None:
+        self.evaluated: list[int] = []
+
+    def __call__(self, idx: ArrayLike, /) -> NDArray:
+        indices = np.array(idx)
+        self.evaluated.extend(indices.tolist())
+        return indices * 10.0
+
+
+def test_cached_index_evaluator() -> None:
+    counting = CountingEvaluator()
+    cached = CachedIndexEvaluator(counting)
+
+    assert np.allclose(cached([1, 2, 2, 3]), [10, 20, 20, 30])
+    assert np.allclose(cached([3, 4, 1]), [30, 40, 10])
+
+    # Every index is only evaluated once.
+    assert sorted(counting.evaluated) == [1, 2, 3, 4], counting.evaluated
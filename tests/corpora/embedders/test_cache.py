@@ -0,0 +1,80 @@
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import torch
+from torch import Tensor
+
+from bocoel import Embedder
+from tests.corpora.storages import factories
+
+
+class CountingEmbedder(Embedder):
+    def __init__(self, cache_id: str | None = "counting") -> None:
+        self.calls = 0
+        self._cache_id = cache_id
+
+    @property
+    def cache_id(self) -> str | None:
+        return self._cache_id
+
+    @property
+    def batch(self) -> int:
+        return 3
+
+    @property
+    def dims(self) -> int:
+        return 2
+
+    def _encode(self, texts: Sequence[str], /) -> Tensor:
+        self.calls += 1
+        return torch.tensor([[len(text), text.count(" ")] for text in texts]).float()
+
+
+def transform(mapping: Mapping[str, Sequence[Any]]) -> Sequence[str]:
+    return mapping["question"]
+
+
+def test_encode_storage_cache(tmp_path: Path) -> None:
+    storage = factories.df_storage()
+    embedder = CountingEmbedder()
+
+    uncached = embedder.encode_storage(storage, transform=transform)
+    calls = embedder.calls
+
+    first = embedder.encode_storage(storage, transform=transform, cache_dir=tmp_path)
+    assert embedder.calls == 2 * calls
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert not list(tmp_path.glob("*.tmp")), "Temporary files should be moved."
+
+    second = embedder.encode_storage(storage, transform=transform, cache_dir=tmp_path)
+    assert embedder.calls == 2 * calls, "Cache hit should not encode."
+    assert isinstance(second, np.memmap)
+
+    out = np.empty_like(uncached)
+    third = embedder.encode_storage(
+        storage, transform=transform, out=out, cache_dir=tmp_path
+    )
+    assert third is out
+
+    assert np.allclose(uncached, first)
+    assert np.allclose(uncached, second)
+    assert np.allclose(uncached, third)
+
+
+def test_encode_storage_cache_id(tmp_path: Path) -> None:
+    storage = factories.df_storage()
+
+    for cache_id in ["first", "second"]:
+        embedder = CountingEmbedder(cache_id=cache_id)
+        embedder.encode_storage(storage, transform=transform, cache_dir=tmp_path)
+
+    # Embedders with different ids do not share cached embeddings.
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    embedder = CountingEmbedder(cache_id=None)
+    embedder.encode_storage(storage, transform=transform, cache_dir=tmp_path)
+
+    # Embedders without ids are not cached.
+    assert len(list(tmp_path.glob("*.npy"))) == 2
@@ -18,12 +18,17 @@ def emb() -> NDArray:
     return index_utils.normalize(random.randn(7, 5) + np.arange(7)[:, None])
 
 
-def hnsw_index(embeddings: NDArray) -> Index:
-    return HnswlibIndex(embeddings=embeddings, distance=Distance.INNER_PRODUCT)
+def hnsw_index(embeddings: NDArray, brute_threshold: int = 0) -> Index:
+    return HnswlibIndex(
+        embeddings=embeddings,
+        distance=Distance.INNER_PRODUCT,
+        brute_threshold=brute_threshold,
+    )
 
 
 def hnswlib_kwargs() -> dict[str, Any]:
-    return {"threads": -1}
+    # The fixtures are tiny, so the graph must be forced to be built.
+    return {"threads": -1, "brute_threshold": 0}
 
 
 def whiten_kwargs() -> dict[str, Any]:
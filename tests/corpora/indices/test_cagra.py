@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from numpy import random
+from numpy.typing import NDArray
+
+from bocoel import CagraIndex, Distance
+from bocoel.corpora.indices import utils
+
+pytest.importorskip("cuvs")
+cupy = pytest.importorskip("cupy")
+
+
+def _cuda_available() -> bool:
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except cupy.cuda.runtime.CUDARuntimeError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _cuda_available(), reason="CUDA is unavailable.")
+
+
+def emb() -> NDArray:
+    # CAGRA requires more embeddings than the graph degree.
+    return utils.normalize(random.default_rng(42).standard_normal([256, 16]))
+
+
+def index(distance: Distance) -> CagraIndex:
+    return CagraIndex(
+        embeddings=emb(),
+        distance=distance,
+        graph_degree=16,
+        intermediate_graph_degree=32,
+    )
+
+
+@pytest.mark.parametrize("distance", [Distance.L2, Distance.INNER_PRODUCT])
+def test_init_cagra(distance: Distance) -> None:
+    embeddings = emb()
+    search = index(distance)
+    assert search.dims == embeddings.shape[1]
+
+
+@pytest.mark.parametrize("distance", [Distance.L2, Distance.INNER_PRODUCT])
+def test_cagra_search_shape(distance: Distance) -> None:
+    embeddings = emb()
+    idx = index(distance)
+
+    result = idx.search(embeddings[:5], k=3)
+
+    assert result.indices.shape == (5, 3), result.indices.shape
+    assert result.distances.shape == (5, 3), result.distances.shape
+    assert result.vectors.shape == (5, 3, embeddings.shape[1]), result.vectors.shape
+
+
+@pytest.mark.parametrize("distance", [Distance.L2, Distance.INNER_PRODUCT])
+def test_cagra_search_match(distance: Distance) -> None:
+    embeddings = emb()
+    idx = index(distance)
+
+    result = idx.search(embeddings[:5])
+
+    assert np.all(result.indices[:, 0] == np.arange(5)), {
+        "results": result,
+        "embeddings": embeddings,
+    }
+    assert np.allclose(result.vectors[:, 0], embeddings[:5], atol=1e-5), {
+        "results": result,
+        "embeddings": embeddings,
+    }
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from bocoel import Distance, FaissIndex
+from bocoel import Distance, FaissHnswIndex, FaissIndex, PqHnswIndex
 from bocoel.corpora.indices import utils
 from tests import utils as test_utils
 
@@ -74,3 +74,92 @@ def test_faiss_search_mismatch(index_string: str, device: str) -> None:
         "results": result,
         "embeddings": embeddings,
     }
+
+
+def hnsw_index() -> FaissHnswIndex:
+    embeddings = factories.emb()
+    return FaissHnswIndex(embeddings=embeddings, distance=Distance.INNER_PRODUCT)
+
+
+def test_init_faiss_hnsw() -> None:
+    embeddings = factories.emb()
+    search = hnsw_index()
+    assert search.dims == embeddings.shape[1]
+
+
+def test_faiss_hnsw_search_match() -> None:
+    embeddings = factories.emb()
+    idx = hnsw_index()
+
+    query = [embeddings[0]]
+    normalized = utils.normalize(query)
+
+    result = idx.search(normalized)
+
+    # Distances are computed on 8-bit codes, so they are approximate.
+    assert np.isclose(result.distances, 1, atol=1e-2), {
+        "results": result,
+        "embeddings": embeddings,
+    }
+    assert np.allclose(result.vectors, query, atol=1e-5), {
+        "results": result,
+        "embeddings": embeddings,
+    }
+    assert result.indices == 0, {
+        "results": result,
+        "embeddings": embeddings,
+    }
+
+
+def pq_hnsw_index() -> PqHnswIndex:
+    embeddings = factories.emb()
+
+    # Few embeddings, so codebooks must be small enough to be trained.
+    return PqHnswIndex(
+        embeddings=embeddings,
+        distance=Distance.INNER_PRODUCT,
+        pq_m=embeddings.shape[1],
+        pq_nbits=2,
+    )
+
+
+def test_init_pq_hnsw() -> None:
+    embeddings = factories.emb()
+    search = pq_hnsw_index()
+    assert search.dims == embeddings.shape[1]
+
+
+def test_pq_hnsw_search() -> None:
+    embeddings = factories.emb()
+    idx = pq_hnsw_index()
+
+    query = utils.normalize(embeddings[:3])
+    result = idx.search(query, k=2)
+
+    assert result.indices.shape == (3, 2), result.indices.shape
+    assert np.all((result.indices >= 0) & (result.indices < len(embeddings))), {
+        "results": result,
+        "embeddings": embeddings,
+    }
+
+
+def test_pq_hnsw_indivisible_dims() -> None:
+    embeddings = factories.emb()
+
+    with pytest.raises(ValueError):
+        PqHnswIndex(
+            embeddings=embeddings, distance=Distance.INNER_PRODUCT, pq_m=2, pq_nbits=2
+        )
+
+
+def test_faiss_hnsw_half() -> None:
+    embeddings = factories.emb().astype(np.float16)
+    idx = FaissHnswIndex(
+        embeddings=embeddings, distance=Distance.INNER_PRODUCT, quantizer="fp16"
+    )
+
+    result = idx.search(embeddings[:1].astype(np.float32))
+    assert result.indices == 0, {
+        "results": result,
+        "embeddings": embeddings,
+    }
@@ -1,24 +1,32 @@
 import numpy as np
+import pytest
 
-from bocoel import Index
+from bocoel import Distance, HnswlibIndex, Index
 from bocoel.corpora.indices import utils
 
 from . import factories
 
 
-def get_index() -> Index:
+def get_index(brute_threshold: int) -> Index:
     embeddings = factories.emb()
 
-    return factories.hnsw_index(embeddings)
+    return factories.hnsw_index(embeddings, brute_threshold=brute_threshold)
 
 
-def test_init_hnswlib() -> None:
+def brute_thresholds() -> list[int]:
+    # Graph and exact search respectively.
+    return [0, len(factories.emb()) + 1]
+
+
+@pytest.mark.parametrize("brute_threshold", brute_thresholds())
+def test_init_hnswlib(brute_threshold: int) -> None:
     embeddings = factories.emb()
 
-    assert get_index().dims == embeddings.shape[1]
+    assert get_index(brute_threshold).dims == embeddings.shape[1]
 
 
-def test_hnswlib_search_match() -> None:
+@pytest.mark.parametrize("brute_threshold", brute_thresholds())
+def test_hnswlib_search_match(brute_threshold: int) -> None:
     embeddings = factories.emb()
 
     query = [embeddings[0]]
@@ -26,7 +34,7 @@ def test_hnswlib_search_match() -> None:
 
     assert normalized.ndim == 2, normalized.shape
 
-    result = get_index().search(normalized)
+    result = get_index(brute_threshold).search(normalized)
     # See https://github.com/nmslib/hnswlib#supported-distances
     assert np.isclose(result.distances, 1 - 1, atol=1e-5), {
         "results": result,
@@ -42,7 +50,8 @@ def test_hnswlib_search_match() -> None:
     }
 
 
-def test_hnswlib_search_mismatch() -> None:
+@pytest.mark.parametrize("brute_threshold", brute_thresholds())
+def test_hnswlib_search_mismatch(brute_threshold: int) -> None:
     embeddings = factories.emb()
 
     e0 = [embeddings[0]]
@@ -51,7 +60,7 @@ def test_hnswlib_search_mismatch() -> None:
 
     assert normalized.ndim == 2, normalized.shape
 
-    result = get_index().search(normalized)
+    result = get_index(brute_threshold).search(normalized)
     assert np.allclose(result.vectors, e0, atol=1e-5), {
         "results": result,
         "embeddings": embeddings,
@@ -60,3 +69,80 @@ def test_hnswlib_search_mismatch() -> None:
         "results": result,
         "embeddings": embeddings,
     }
+
+
+def test_hnswlib_graph_params() -> None:
+    embeddings = factories.emb()
+    idx = HnswlibIndex(
+        embeddings=embeddings,
+        distance=Distance.INNER_PRODUCT,
+        m=4,
+        ef_construction=8,
+        ef_search=4,
+        brute_threshold=0,
+    )
+
+    # The graph parameters are forwarded to hnswlib.
+    graph = idx._index
+    assert (graph.M, graph.ef_construction, graph.ef) == (4, 8, 4), graph
+
+    result = idx.search(embeddings[:1])
+    assert result.indices == 0, {
+        "results": result,
+        "embeddings": embeddings,
+    }
+
+
+@pytest.mark.parametrize("k", [1, 3])
+@pytest.mark.parametrize("distance", [Distance.L2, Distance.INNER_PRODUCT])
+def test_hnswlib_brute_matches_graph(distance: Distance, k: int) -> None:
+    embeddings = factories.emb()
+    brute = HnswlibIndex(embeddings=embeddings, distance=distance)
+    graph = HnswlibIndex(embeddings=embeddings, distance=distance, brute_threshold=0)
+
+    query = utils.normalize(embeddings + embeddings[::-1] / 2)
+    brute_result = brute.search(query, k=k)
+    graph_result = graph.search(query, k=k)
+
+    assert np.all(brute_result.indices == graph_result.indices), {
+        "brute": brute_result,
+        "graph": graph_result,
+    }
+    assert np.allclose(brute_result.distances, graph_result.distances, atol=1e-5), {
+        "brute": brute_result,
+        "graph": graph_result,
+    }
+
+
+@pytest.mark.parametrize("distance", [Distance.L2, Distance.INNER_PRODUCT])
+def test_hnswlib_brute_float64_query(distance: Distance) -> None:
+    embeddings = factories.emb().astype(np.float32)
+    idx = HnswlibIndex(embeddings=embeddings, distance=distance)
+
+    # Queries from the optimizers are lists of python floats (float64).
+    query = embeddings[:3].astype(np.float64).tolist()
+    result = idx.search(query)
+
+    assert np.all(result.indices[:, 0] == np.arange(3)), {
+        "results": result,
+        "embeddings": embeddings,
+    }
+
+    # The corpus is not promoted to float64 for the search.
+    assert result.distances.dtype == np.float32, result.distances.dtype
+
+
+def test_hnswlib_half() -> None:
+    embeddings = factories.emb().astype(np.float16)
+
+    for brute_threshold in [0, len(embeddings) + 1]:
+        idx = HnswlibIndex(
+            embeddings=embeddings,
+            distance=Distance.INNER_PRODUCT,
+            brute_threshold=brute_threshold,
+        )
+        result = idx.search(embeddings[:1].astype(np.float32))
+        assert result.indices == 0, {
+            "results": result,
+            "embeddings": embeddings,
+        }
@@ -12,3 +12,21 @@ def test_normalize() -> None:
         "normalized": normalized,
         "embeddings": embeddings,
     }
+
+
+def test_normalize_l1() -> None:
+    embeddings = np.array([[1, 3], [-2, 2]])
+    normalized = utils.normalize(embeddings, p=1)
+    assert np.allclose(np.abs(normalized).sum(axis=-1), 1), {
+        "normalized": normalized,
+        "embeddings": embeddings,
+    }
+
+
+def test_normalize_half() -> None:
+    embeddings = np.full([3, 4], 300, dtype=np.float16)
+    normalized = utils.normalize(embeddings)
+
+    # Squares of 300 overflow in float16, so the norm must be computed in float32.
+    assert normalized.dtype == np.float16, normalized.dtype
+    assert np.allclose(normalized, 0.5, atol=1e-3), normalized
@@ -1,12 +1,37 @@
+import numpy as np
 import pytest
 
-from bocoel import SbertEmbedder
+from bocoel import ComposedCorpus, Distance, HnswlibIndex, SbertEmbedder
 from tests import utils
 
 from . import factories
+from .indices import factories as index_factories
+from .storages import factories as storage_factories
 
 
 @pytest.mark.parametrize("device", utils.torch_devices())
 def test_init_corpus(device: str) -> None:
     embedder = SbertEmbedder(device=device)
     _ = factories.corpus(embedder=embedder)
+
+
+@pytest.mark.parametrize("brute_threshold", [0, 50_000])
+def test_index_embeddings_half(brute_threshold: int) -> None:
+    storage = storage_factories.df_storage()
+    embeddings = index_factories.emb()[: len(storage)].astype(np.float32)
+
+    corpus = ComposedCorpus.index_embeddings(
+        storage=storage,
+        embeddings=embeddings,
+        index_backend=HnswlibIndex,
+        half=True,
+        distance=Distance.INNER_PRODUCT,
+        brute_threshold=brute_threshold,
+    )
+
+    # Graph indices keep half precision, exact search upcasts (and keeps one copy).
+    expected = np.float16 if brute_threshold == 0 else np.float32
+    assert corpus.index.data.dtype == expected, corpus.index.data.dtype
+
+    result = corpus.index.search(embeddings[:1])
+    assert result.indices[0, 0] == 0, result
@@ -1,6 +1,11 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
 import pytest
+from numpy.typing import NDArray
 
-from bocoel import SbertEmbedder
+from bocoel import BigBenchMultipleChoice, ClassifierModel, SbertEmbedder
 from tests import utils
 from tests.corpora import factories as corpus_factories
 from tests.models.lms import factories as lm_factories
@@ -33,3 +38,52 @@ def test_bigbench_adaptor_on_corpus(adaptor_name: str, device: str) -> None:
     assert len(results) == 2
 
     assert all(0 <= r <= 1 for r in results), {"results": results, "corpus": corpus}
+
+
+class FirstChoiceModel(ClassifierModel):
+    @property
+    def choices(self) -> Sequence[str]:
+        return ["1", "2", "3"]
+
+    def _classify(self, prompts: Sequence[str], /) -> NDArray:
+        logits = np.zeros([len(prompts), len(self.choices)])
+        logits[:, 0] = 1
+        return logits
+
+
+def multiple_choice_data() -> dict[str, Any]:
+    return {
+        "inputs": ["what's up?", "who is home?"],
+        "multiple_choice_targets": [["not much", "nothing"], ["no one", "me"]],
+        "multiple_choice_scores": [[1, 0], [0, 1]],
+    }
+
+
+def test_bigbench_multiple_choice_checks_first_call() -> None:
+    adaptor = BigBenchMultipleChoice(FirstChoiceModel())
+
+    data = multiple_choice_data()
+    data["multiple_choice_targets"] = [["not much", "nothing"], ["no one", 1]]
+
+    # The first call checks every entry.
+    with pytest.raises(TypeError):
+        adaptor.evaluate(data)
+
+
+def test_bigbench_multiple_choice_spot_checks() -> None:
+    adaptor = BigBenchMultipleChoice(FirstChoiceModel())
+
+    results = adaptor.evaluate(multiple_choice_data())
+    assert np.allclose(results, [1, 0]), results
+
+    # Later calls only check the first entry, with the same exception type.
+    for key, value in [
+        ("inputs", [1, "who is home?"]),
+        ("multiple_choice_targets", ["not much", ["no one", "me"]]),
+        ("multiple_choice_scores", [["1", "0"], [0, 1]]),
+    ]:
+        data = multiple_choice_data()
+        data[key] = value
+
+        with pytest.raises(TypeError):
+            adaptor.evaluate(data)
@@ -18,12 +18,13 @@ def generative_lm(device: str) -> GenerativeModel:
 
 
 @utils.cache
-def logits_lm(device: str) -> ClassifierModel:
+def logits_lm(device: str, workers: int = 1) -> ClassifierModel:
     return HuggingfaceLogitsLM(
         model_path="bert-base-uncased",
         device=device,
         batch_size=4,
         choices=["negative", "positive"],
+        workers=workers,
     )
 
 
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 
+import numpy as np
 import pytest
 
 from bocoel import ClassifierModel, GenerativeModel
@@ -39,3 +40,18 @@ def test_lm_classify(
         "prompts": prompts,
     }
     assert logits.shape[-1] == 2, logits.shape
+
+
+@pytest.mark.parametrize("device", utils.torch_devices())
+def test_logits_lm_workers(device: str) -> None:
+    # More prompts than the batch size, s.t. batches are run by multiple workers.
+    prompts = ["Hello, my name is", "I am a", "I like to eat"] * 3
+
+    serial = factories.logits_lm(device).classify(prompts)
+    pooled = factories.logits_lm(device, workers=3).classify(prompts)
+
+    assert pooled.shape == (len(prompts), 2), pooled.shape
+    assert np.allclose(serial, pooled, atol=1e-5), {
+        "serial": serial,
+        "pooled": pooled,
+    }